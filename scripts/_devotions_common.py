@@ -0,0 +1,166 @@
+"""
+_devotions_common.py
+
+Shared helpers for the devotion migration scripts: date normalization,
+legacy JSON loading and SoulStart_* file discovery. Keeping them in one
+module means the date cache and JSON backend are set up once per process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+from datetime import date, datetime
+
+try:
+    import orjson  # optional: much faster JSON decode/encode
+except ImportError:
+    orjson = None
+
+
+# Accepted legacy date formats, tried in order after the ISO fast path
+_DATE_FMTS = (
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%m-%d-%Y",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+)
+
+
+def _is_iso(s: str) -> bool:
+    """Cheap shape check for YYYY-MM-DD (does not validate the calendar)."""
+    return (
+        len(s) == 10
+        and s.isascii()
+        and s[4] == "-"
+        and s[7] == "-"
+        and s[:4].isdigit()
+        and s[5:7].isdigit()
+        and s[8:].isdigit()
+    )
+
+
+@lru_cache(maxsize=4096)
+def normalize_date_str(s: str | None) -> str | None:
+    """Normalize many date formats to YYYY-MM-DD."""
+    if not s:
+        return None
+    # Most legacy keys are already ISO: skip strip() and the strptime loop
+    if _is_iso(s):
+        try:
+            date(int(s[:4]), int(s[5:7]), int(s[8:]))
+            return s
+        except ValueError:
+            return None
+    s = s.strip()
+    for fmt in _DATE_FMTS:
+        try:
+            return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
+        except Exception:
+            continue
+    return None
+
+
+def walk_soulstart_files(root: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Collect SoulStart_Sunrise_*.json and SoulStart_Sunset_*.json files
+    under root in a single directory walk.
+    """
+    sunrise: list[Path] = []
+    sunset: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".json"):
+                    if e.name.startswith("SoulStart_Sunrise_"):
+                        sunrise.append(Path(e.path))
+                    elif e.name.startswith("SoulStart_Sunset_"):
+                        sunset.append(Path(e.path))
+    # Stable order so merge precedence does not depend on the filesystem
+    sunrise.sort()
+    sunset.sort()
+    return sunrise, sunset
+
+
+def load_json(path: Path):
+    try:
+        raw = path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)  # stdlib json also decodes bytes directly
+    except Exception:
+        return None
+
+
+# Keys that may carry an entry's date, in lookup priority
+DATE_FIELDS = ("date", "DATE", "Date", "day", "Day")
+
+
+def _entry_date(v: dict):
+    """First truthy value among DATE_FIELDS, in priority order."""
+    for f in DATE_FIELDS:
+        dd = v.get(f)
+        if dd:
+            return dd
+    return None
+
+
+def iter_entries(data) -> Iterator[tuple[str, dict]]:
+    """
+    Yield (iso_date, entry_dict) from legacy JSON structure.
+    """
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if type(v) is not dict:
+                continue
+            norm = normalize_date_str(str(k))
+            if not norm:
+                # Try inside the dict
+                dd = _entry_date(v)
+                norm = normalize_date_str(str(dd)) if dd else None
+            if norm:
+                yield norm, v
+
+    elif isinstance(data, list):
+        for v in data:
+            if type(v) is not dict:
+                continue
+            dd = _entry_date(v)
+            norm = normalize_date_str(str(dd)) if dd else None
+            if norm:
+                yield norm, v
+
+
+def load_entries(path: Path) -> list[tuple[str, dict]]:
+    """
+    Load one legacy file and return its (iso_date, entry_dict) pairs.
+    Module-level so it can run in a worker process.
+    """
+    data = load_json(path)
+    if not data:
+        return []
+    return list(iter_entries(data))
+
+
+def write_json(data, path: Path) -> None:
+    """Write data as indented UTF-8 JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # Stream chunks to disk instead of building one big string
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(encoder.iterencode(data))
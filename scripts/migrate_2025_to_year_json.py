@@ -7,9 +7,12 @@ all 2025 Sunrise/Sunset monthly JSON files.
 
 from __future__ import annotations
 
-import json
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+from _devotions_common import load_entries, walk_soulstart_files, write_json
 
 # -------- Paths --------
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -32,80 +35,42 @@ DEV_DIR.mkdir(parents=True, exist_ok=True)
 
 OUT_FILE = DEV_DIR / "devotions_2025.json"
 
+# Standalone 4-digit years in a path, e.g. ".../2024/SoulStart_Sunrise_Aug.json"
+YEAR_TOKEN_RE = re.compile(r"(?<!\d)(?:19|20)\d\d(?!\d)")
 
-def normalize_date_str(s: str | None) -> str | None:
-    """Normalize many date formats to YYYY-MM-DD."""
-    if not s:
-        return None
-    s = s.strip()
-    fmts = [
-        "%Y-%m-%d",
-        "%d-%m-%Y",
-        "%m-%d-%Y",
-        "%Y/%m/%d",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%d %b %Y",
-        "%d %B %Y",
-    ]
-    for fmt in fmts:
-        try:
-            return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
-        except Exception:
-            continue
-    return None
 
+def may_hold_year(path: Path, year: int) -> bool:
+    """False only when the path under LEGACY_ROOT names some other year."""
+    years = YEAR_TOKEN_RE.findall(str(path.relative_to(LEGACY_ROOT)))
+    return not years or str(year) in years
 
-def load_json(path: Path):
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
 
+# Output slot field -> legacy keys to try, first non-empty value wins
+SLOT_FIELDS: dict[str, tuple[str, ...]] = {
+    "title": ("title", "Theme", "theme"),
+    "verse_ref": ("verse_ref", "scripture"),
+    "verse_text": ("verse_text", "verseText"),
+    # 2025 declaration structure
+    "encouragement_intro": ("encouragement_intro", "intro"),
+    "point1": ("point1",),
+    "point2": ("point2",),
+    "point3": ("point3",),
+    # Common closing + prayer
+    "closing": ("closing", "reflection", "note", "thought"),
+    "prayer": ("prayer", "morning_prayer", "night_prayer"),
+}
 
-def iter_entries(data) -> list[tuple[str, dict]]:
-    """
-    Yield (iso_date, entry_dict) from legacy JSON structure.
-    """
-    results: list[tuple[str, dict]] = []
+THEME_FIELDS = ("theme", "Theme", "title")
 
-    if isinstance(data, dict):
-        for k, v in data.items():
-            if not isinstance(v, dict):
-                continue
-            norm = normalize_date_str(str(k))
-            if not norm:
-                # Try inside the dict
-                dd = (
-                    v.get("date")
-                    or v.get("DATE")
-                    or v.get("Date")
-                    or v.get("day")
-                    or v.get("Day")
-                )
-                norm = normalize_date_str(str(dd)) if dd else None
-            if norm:
-                results.append((norm, v))
-
-    elif isinstance(data, list):
-        for v in data:
-            if not isinstance(v, dict):
-                continue
-            dd = (
-                v.get("date")
-                or v.get("DATE")
-                or v.get("Date")
-                or v.get("day")
-                or v.get("Day")
-            )
-            norm = normalize_date_str(str(dd)) if dd else None
-            if norm:
-                results.append((norm, v))
 
-    return results
+def first_value(entry: dict, keys: tuple[str, ...]):
+    """Return the first truthy value among keys, else ""."""
+    for k in keys:
+        if k in entry:
+            v = entry[k]
+            if v:
+                return v
+    return ""
 
 
 def map_slot(entry: dict) -> dict:
@@ -116,87 +81,46 @@ def map_slot(entry: dict) -> dict:
     if entry is None:
         return {}
 
-    return {
-        "title": (
-            entry.get("title")
-            or entry.get("Theme")
-            or entry.get("theme")
-            or ""
-        ),
-        "verse_ref": entry.get("verse_ref") or entry.get("scripture") or "",
-        "verse_text": entry.get("verse_text") or entry.get("verseText") or "",
-
-        # 2025 declaration structure
-        "encouragement_intro": (
-            entry.get("encouragement_intro")
-            or entry.get("intro")
-            or ""
-        ),
-        "point1": entry.get("point1") or "",
-        "point2": entry.get("point2") or "",
-        "point3": entry.get("point3") or "",
-
-        # Common closing + prayer
-        "closing": (
-            entry.get("closing")
-            or entry.get("reflection")
-            or entry.get("note")
-            or entry.get("thought")
-            or ""
-        ),
-        "prayer": (
-            entry.get("prayer")
-            or entry.get("morning_prayer")
-            or entry.get("night_prayer")
-            or ""
-        ),
-    }
+    return dict(zip(SLOT_FIELDS, [first_value(entry, keys) for keys in SLOT_FIELDS.values()]))
 
 
 def main():
     # Find all sunrise/sunset files for 2025 under legacy root
     # Assumes structure like devotions_legacy/August/SoulStart_Sunrise_Aug.json, etc.
-    sunrise_files = list(LEGACY_ROOT.rglob("SoulStart_Sunrise_*.json"))
-    sunset_files = list(LEGACY_ROOT.rglob("SoulStart_Sunset_*.json"))
+    sunrise_files, sunset_files = walk_soulstart_files(LEGACY_ROOT)
+    # Skip decoding files that are clearly for another year
+    sunrise_files = [p for p in sunrise_files if may_hold_year(p, 2025)]
+    sunset_files = [p for p in sunset_files if may_hold_year(p, 2025)]
 
     if not sunrise_files and not sunset_files:
         print(f"No Sunrise/Sunset JSON files found under {LEGACY_ROOT}, aborting.")
         raise SystemExit(1)
 
-    sunrise_map: dict[str, dict] = {}
-    sunset_map: dict[str, dict] = {}
+    # iso date -> {"morning": entry, "night": entry}
+    merged: defaultdict[str, dict[str, dict]] = defaultdict(dict)
 
-    # Load Sunrise
-    for path in sunrise_files:
-        data = load_json(path)
-        if not data:
-            continue
-        for iso, entry in iter_entries(data):
-            # Only keep 2025
-            if not iso.startswith("2025-"):
-                continue
-            sunrise_map[iso] = entry
+    # Decode files in parallel; merge in file order so later files still win
+    paths = sunrise_files + sunset_files
+    with ProcessPoolExecutor() as ex:
+        loaded = list(ex.map(load_entries, paths, chunksize=4))
 
-    # Load Sunset
-    for path in sunset_files:
-        data = load_json(path)
-        if not data:
-            continue
-        for iso, entry in iter_entries(data):
+    for i, pairs in enumerate(loaded):
+        slot = "morning" if i < len(sunrise_files) else "night"
+        for iso, entry in pairs:
+            # Only keep 2025
             if not iso.startswith("2025-"):
                 continue
-            sunset_map[iso] = entry
-
-    all_dates = sorted(set(sunrise_map.keys()) | set(sunset_map.keys()))
+            merged[iso][slot] = entry
 
-    if not all_dates:
+    if not merged:
         print("No 2025 dates found in legacy files, aborting.")
         raise SystemExit(1)
 
     records = []
-    for iso in all_dates:
-        s_entry = sunrise_map.get(iso)
-        n_entry = sunset_map.get(iso)
+    for iso in sorted(merged):
+        m = merged[iso]
+        s_entry = m.get("morning")
+        n_entry = m.get("night")
 
         # Skip dates that have neither side (should not happen)
         if not s_entry and not n_entry:
@@ -205,19 +129,9 @@ def main():
         # Use morning theme or fallback to night or blank
         theme = ""
         if s_entry:
-            theme = (
-                s_entry.get("theme")
-                or s_entry.get("Theme")
-                or s_entry.get("title")
-                or ""
-            )
+            theme = first_value(s_entry, THEME_FIELDS)
         if not theme and n_entry:
-            theme = (
-                n_entry.get("theme")
-                or n_entry.get("Theme")
-                or n_entry.get("title")
-                or ""
-            )
+            theme = first_value(n_entry, THEME_FIELDS)
 
         record = {
             "date": iso,
@@ -234,9 +148,7 @@ def main():
     if OUT_FILE.exists():
         print(f"WARNING: {OUT_FILE} already exists and will be OVERWRITTEN.")
 
-    OUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with OUT_FILE.open("w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+    write_json(records, OUT_FILE)
 
     print(f"Wrote {len(records)} days to {OUT_FILE}")
 
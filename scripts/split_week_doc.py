@@ -13,9 +13,9 @@ Outputs:
 - week_cards.csv   (for spreadsheet/review)
 """
 
-import json, csv, re
+import json, csv, re, zipfile
 from pathlib import Path
-from docx import Document
+from lxml import etree  # installed with python-docx
 
 # --- Paths ---
 BASE = Path(__file__).resolve().parents[1]
@@ -26,13 +26,56 @@ CSV_OUT  = DEV / "week1_cards.csv"
 
 # --- Regex patterns ---
 DAY_RE = re.compile(r"^\s*(?:Day|DAY)\s*([1-7])\b[:\-]?\s*(.*)$")
-SCRIPTURE_RE = re.compile(r"([1-3]?\s?[A-Za-z]+\s+\d{1,3}:\d{1,3}(?:[-–]\d{1,3})?)")
+# Possessive/atomic parts (Python 3.11+) so long prose lines can't backtrack
+SCRIPTURE_RE = re.compile(r"([1-3]?\s?[A-Za-z]++\s++(?>\d{1,3}:\d{1,3})(?:[-–]\d{1,3})?)")
+DAY_PREFIXES = ("Day", "DAY")
+
+# --- DOCX XML ---
+# Private to this script: scripts/ runs as its own script root and cannot
+# import tools/_docx_common.py, which serves the tools/ ingesters.
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY, W_P, W_R, W_T, W_BR, W_TBL, W_HYPERLINK = (
+    W + "body", W + "p", W + "r", W + "t", W + "br", W + "tbl", W + "hyperlink"
+)
+# Other run children that python-docx renders as text
+RUN_TEXT = {W + "tab": "\t", W + "ptab": "\t", W + "cr": "\n", W + "noBreakHyphen": "-"}
+
+def _run_text(r) -> str:
+    parts = []
+    for e in r:
+        if e.tag == W_T:
+            parts.append(e.text or "")
+        elif e.tag == W_BR:
+            # page/column breaks carry no text, line breaks are newlines
+            parts.append("\n" if e.get(W + "type", "textWrapping") == "textWrapping" else "")
+        else:
+            parts.append(RUN_TEXT.get(e.tag, ""))
+    return "".join(parts)
+
+def _iter_paragraph_texts(docx_path: Path):
+    """Body paragraph texts from word/document.xml, as python-docx's Paragraph.text."""
+    with zipfile.ZipFile(docx_path) as z, z.open("word/document.xml") as f:
+        for _, el in etree.iterparse(f, events=("end",), tag=(W_P, W_TBL)):
+            parent = el.getparent()
+            if parent is None or parent.tag != W_BODY:
+                continue  # table-cell paragraphs are not body paragraphs
+            if el.tag == W_P:
+                parts = []
+                for c in el:
+                    if c.tag == W_R:
+                        parts.append(_run_text(c))
+                    elif c.tag == W_HYPERLINK:
+                        parts.extend(_run_text(r) for r in c.iterchildren(W_R))
+                yield "".join(parts)
+            # Drop finished body elements so long documents stay flat in memory
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
 
 def split_week_doc(docx_path: Path) -> list[dict]:
     if not docx_path.exists():
         raise FileNotFoundError(f"Missing {docx_path}. Place your DOCX there.")
 
-    doc = Document(str(docx_path))
     days, current = {}, None
 
     def start_day(num, title):
@@ -41,19 +84,20 @@ def split_week_doc(docx_path: Path) -> list[dict]:
         current = {"day": key, "title": title.strip() or key, "scripture": "", "points": []}
         days[key] = current
 
-    for p in doc.paragraphs:
-        text = (p.text or "").strip()
+    for text in _iter_paragraph_texts(docx_path):
+        text = text.strip()
         if not text:
             continue
-        m = DAY_RE.match(text)
+        # Cheap prefix check before the regex (text is already stripped)
+        m = DAY_RE.match(text) if text.startswith(DAY_PREFIXES) else None
         if m:
             start_day(m.group(1), m.group(2) or "")
             continue
         if current is None:
             continue  # ignore preface
 
-        # Scripture?
-        if not current["scripture"]:
+        # Scripture? (refs always have "chapter:verse", so skip lines without a colon)
+        if not current["scripture"] and ":" in text:
             refs = SCRIPTURE_RE.findall(text)
             if refs:
                 current["scripture"] = "; ".join(refs)
@@ -74,14 +118,13 @@ def write_outputs(data: list[dict], json_path: Path = JSON_OUT, csv_path: Path =
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+    with open(csv_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["Day", "Title", "Scripture", "Points"])
-        for d in data:
-            w.writerow([
-                d["day"], d["title"], d["scripture"],
-                "; ".join(d.get("points", []))
-            ])
+        w.writerows(
+            (d["day"], d["title"], d["scripture"], "; ".join(d.get("points", [])))
+            for d in data
+        )
 
     print(f"✅ Wrote {json_path.name} and {csv_path.name} with {len(data)} days.")
     print("— Summary —")
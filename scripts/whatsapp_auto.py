@@ -12,19 +12,25 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
+import re
 import sys
 import time
-import webbrowser
-import platform
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
-# Force UTF-8 output so emojis don't crash on Windows
-sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+try:
+    import orjson  # optional: faster JSON decode
+except ImportError:
+    orjson = None
+
+# Force UTF-8 output so emojis don't crash on Windows (skip if already UTF-8)
+for _stream in (sys.stdout, sys.stderr):
+    if (_stream.encoding or "").lower().replace("_", "-") not in ("utf-8", "utf8"):
+        _stream.reconfigure(encoding="utf-8", errors="replace")
 
 # ---------- settings (env-aware) ----------
 BASE_DIR = Path(__file__).resolve().parent.parent  # project root
@@ -41,12 +47,28 @@ PAGE_BOOT_WAIT = int(os.environ.get("PAGE_BOOT_WAIT", "6"))  # initial load afte
 MAX_RECOMMENDED_CHARS = int(os.environ.get("MAX_RECOMMENDED_CHARS", "4000"))
 
 # ---------- helpers ----------
+@functools.lru_cache(maxsize=None)
+def _system_name() -> str:
+    import platform  # only the desktop-automation paths need it
+    return platform.system().lower()
+
 def is_macos() -> bool:
-    return platform.system().lower() == "darwin"
+    return _system_name() == "darwin"
+
+@functools.lru_cache(maxsize=None)
+def meta_key() -> str:
+    """Modifier for WhatsApp Web shortcuts: Cmd on macOS, Ctrl elsewhere."""
+    return "command" if is_macos() else "ctrl"
+
+# The \r countdown is only visible in an interactive terminal
+_STDOUT_TTY = sys.stdout.isatty()
 
 def countdown(label: str, seconds: int) -> None:
     if seconds <= 0:
         return
+    if not _STDOUT_TTY or seconds <= 3:
+        time.sleep(seconds)
+        return
     for i in range(seconds, 0, -1):
         print(f"{label}: {i:>2}s", end="\r", flush=True)
         time.sleep(1)
@@ -54,14 +76,20 @@ def countdown(label: str, seconds: int) -> None:
 
 def open_web() -> None:
     """Open WhatsApp Web and give browser time to render the shell."""
+    import webbrowser  # not needed for --dry-run
     print(f"[Info] Opening: {WHATSAPP_WEB_URL}")
     webbrowser.open(WHATSAPP_WEB_URL)
     countdown("Waiting for WhatsApp Web to boot", PAGE_BOOT_WAIT)
 
+@functools.lru_cache(maxsize=32)
+def _read_json_cached(path_str: str, mtime_ns: int) -> tuple:
+    """Parsed JSON wrapped in a 1-tuple; the mtime in the key invalidates edits."""
+    raw = Path(path_str).read_bytes()
+    return (orjson.loads(raw) if orjson is not None else json.loads(raw),)
+
 def read_json(path: Path):
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_cached(str(path), path.stat().st_mtime_ns)[0]
     except Exception as e:
         print(f"[Warn] Could not read JSON: {path} ({e})")
         return None
@@ -72,62 +100,128 @@ def month_folder_for(dt: datetime) -> Path:
 def month_abbr(dt: datetime) -> str:
     return dt.strftime("%b")
 
-def file_for_mode(dt: datetime, mode: str) -> Path:
-    abbr = month_abbr(dt)
-    if mode == "morning":
-        fname = f"SoulStart_Sunrise_{abbr}.json"
-    elif mode == "night":
-        fname = f"SoulStart_Sunset_{abbr}.json"
-    else:
-        fname = f"SoulStart_Sunrise_{abbr}.json"
-    return month_folder_for(dt) / fname
+# mode -> monthly file prefix (anything else reads the Sunrise file)
+MODE_FILE_PREFIX = {"morning": "SoulStart_Sunrise_", "night": "SoulStart_Sunset_"}
 
+def file_for_mode(dt: datetime, mode: str) -> Path:
+    prefix = MODE_FILE_PREFIX.get(mode, "SoulStart_Sunrise_")
+    return month_folder_for(dt) / f"{prefix}{month_abbr(dt)}.json"
+
+# Date formats grouped by the kind of leading character, so a typical
+# "2025-09-03" only tries the two year-first formats.
+_YEAR_FIRST_FMTS = ("%Y-%m-%d", "%Y/%m/%d")
+_MONTH_NAME_FMTS = ("%b %d, %Y", "%B %d, %Y")
+_DAY_FIRST_FMTS = (
+    "%d-%m-%Y", "%m-%d-%Y",
+    "%m/%d/%Y", "%d/%m/%Y",
+    "%d %b %Y", "%d %B %Y",
+)
+
+def _formats_for(s: str) -> tuple[str, ...]:
+    if s[:4].isdigit():
+        return _YEAR_FIRST_FMTS
+    if s[:1].isalpha():
+        return _MONTH_NAME_FMTS
+    return _DAY_FIRST_FMTS
+
+# Numeric dates in one C-level match: YYYY-M-D / YYYY/M/D or A-B-YYYY / A/B/YYYY
+_YMD_RE = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})", re.ASCII)
+_ABY_RE = re.compile(r"(\d{1,2})([-/])(\d{1,2})\2(\d{4})", re.ASCII)
+
+def _iso(y: int, m: int, d: int) -> Optional[str]:
+    try:
+        date(y, m, d)
+    except ValueError:
+        return None
+    return f"{y:04d}-{m:02d}-{d:02d}"
+
+def _numeric_datestr(s: str) -> tuple[bool, Optional[str]]:
+    """(matched, iso) for purely numeric dates, same precedence as the format list."""
+    m = _YMD_RE.fullmatch(s)
+    if m:
+        return True, _iso(int(m[1]), int(m[3]), int(m[4]))
+    m = _ABY_RE.fullmatch(s)
+    if m:
+        a, b, y = int(m[1]), int(m[3]), int(m[4])
+        # "-" is tried day-first, "/" month-first
+        first, second = ((b, a), (a, b)) if m[2] == "-" else ((a, b), (b, a))
+        return True, _iso(y, *first) or _iso(y, *second)
+    return False, None
+
+@functools.lru_cache(maxsize=4096)
 def normalize_datestr(s: str) -> Optional[str]:
     s = (s or "").strip()
-    fmts = [
-        "%Y-%m-%d", "%d-%m-%Y", "%m-%d-%Y",
-        "%Y/%m/%d", "%m/%d/%Y", "%d/%m/%Y",
-        "%b %d, %Y", "%B %d, %Y", "%d %b %Y", "%d %B %Y",
-    ]
-    for fmt in fmts:
+    matched, iso = _numeric_datestr(s)
+    if matched:
+        return iso
+    for fmt in _formats_for(s):
         try:
             return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
         except Exception:
             continue
     return None
 
-def parse_today_entry(data, target_iso: str) -> Optional[dict]:
+# Keys that may hold an entry's date in list-shaped files, in lookup order
+DATE_KEYS = ("date", "day", "Day", "DATE", "Date")
+
+def _build_iso_index(data) -> dict:
+    """Map each normalized date to its entry; the first entry for a date wins."""
+    index: dict[str, dict] = {}
     if isinstance(data, dict):
         for key, val in data.items():
             norm = normalize_datestr(key)
             if norm is None and isinstance(val, dict):
                 norm = normalize_datestr(str(val.get("date", "") or ""))
-            if norm == target_iso:
-                return val if isinstance(val, dict) else {"value": val}
-        return None
-
-    if isinstance(data, list):
+            if norm is not None and norm not in index:
+                index[norm] = val if isinstance(val, dict) else {"value": val}
+    else:
         for item in data:
             if not isinstance(item, dict):
                 continue
-            if "date" in item and normalize_datestr(str(item.get("date", ""))) == target_iso:
-                return item
-            for k in ("day", "Day", "DATE", "Date"):
-                if k in item and normalize_datestr(str(item.get(k, ""))) == target_iso:
-                    return item
-        return None
+            for k in DATE_KEYS:
+                v = item.get(k)
+                if v is None:
+                    continue
+                norm = normalize_datestr(str(v))
+                if norm is not None and norm not in index:
+                    index[norm] = item
+    return index
+
+@functools.lru_cache(maxsize=32)
+def _iso_index_cached(path_str: str, mtime_ns: int) -> dict:
+    """ISO index of the same cached read_json result, per file version."""
+    return _build_iso_index(_read_json_cached(path_str, mtime_ns)[0])
+
+def _iso_index(data, path: Optional[Path]) -> dict:
+    if path is not None:
+        try:
+            return _iso_index_cached(str(path), path.stat().st_mtime_ns)
+        except Exception:
+            pass  # file moved since read_json; index what we were given
+    return _build_iso_index(data)
+
+def parse_today_entry(data, target_iso: str, path: Optional[Path] = None) -> Optional[dict]:
+    """
+    Entry for target_iso. The date index is only built when the direct key
+    lookup misses; pass the read_json path to build it once per file version.
+    """
+    if isinstance(data, dict):
+        # Shipped files are keyed by ISO date: try the direct hit first
+        hit = data.get(target_iso)
+        if isinstance(hit, dict):
+            return hit
+    if isinstance(data, (dict, list)):
+        return _iso_index(data, path).get(target_iso)
     return None
 
-def build_message_from_entry(mode: str, entry: dict, dt: datetime) -> str:
-    # Promote site instead of WhatsApp community
-    promo_label = "🔗 Visit our website"
-    promo_url = SITE_URL
+_DEFAULT_MORNING_PRAYER = "Lord, order my steps today. Amen."
+_DEFAULT_NIGHT_PRAYER = "Lord, quiet my mind and keep me in Your care. Amen."
+# Promote site instead of WhatsApp community (SITE_URL is fixed at import)
+_PROMO_BLOCK = f"\n🔗 Visit our website\n{SITE_URL}" if SITE_URL else ""
 
+def build_message_from_entry(mode: str, entry: dict, dt: datetime) -> str:
     date_line = dt.strftime("%A, %B %d, %Y")
-
-    def add(lines: list[str], val: Optional[str], prefix: str = "") -> None:
-        if val:
-            lines.append(f"{prefix}{val}" if prefix else val)
+    default_prayer = _DEFAULT_MORNING_PRAYER if mode == "morning" else _DEFAULT_NIGHT_PRAYER
 
     title = entry.get("title") or entry.get("Theme") or entry.get("theme")
     verse_ref = entry.get("verse_ref") or entry.get("verseRef") or entry.get("VerseRef")
@@ -153,54 +247,45 @@ def build_message_from_entry(mode: str, entry: dict, dt: datetime) -> str:
     lines: list[str] = [f"{header} — {date_line}"]
 
     if sunrise:
-        add(lines, f"🕕 Sunrise: {sunrise}")
+        lines.append(f"🕕 Sunrise: {sunrise}")
     if sunset:
-        add(lines, f"🌇 Sunset: {sunset}")
+        lines.append(f"🌇 Sunset: {sunset}")
 
     if is_new:
-        if title:
-            add(lines, f"\n*{title}*")
-        if verse_ref or verse_text:
-            vv = verse_ref or ""
-            if verse_text:
-                vv = f"{vv} — {verse_text}" if vv else verse_text
-            add(lines, f"\n📖 {vv}")
-        if pts:
-            lines.append("")
-            for i, p in enumerate(pts, 1):
-                lines.append(f"{i}. {p}")
-        if closing:
-            add(lines, f"\n✍️ {closing}")
-        add(lines, f"\n🙏 {prayer or ('Lord, order my steps today. Amen.' if mode == 'morning' else 'Lord, quiet my mind and keep me in Your care. Amen.')}")
-        if promo_url:
-            add(lines, f"\n{promo_label}\n{promo_url}")
+        vv = verse_ref or ""
+        if verse_text:
+            vv = f"{vv} — {verse_text}" if vv else verse_text
+        lines.extend(filter(None, (
+            title and f"\n*{title}*",
+            vv and f"\n📖 {vv}",
+            pts and "\n" + "\n".join(f"{i}. {p}" for i, p in enumerate(pts, 1)),
+            closing and f"\n✍️ {closing}",
+            f"\n🙏 {prayer or default_prayer}",
+        )))
 
     elif is_legacy:
         theme_or_title = title or entry.get("theme")
-        if theme_or_title:
-            add(lines, f"\n*{theme_or_title}*")
-        if scripture:
-            add(lines, f"\n📖 {scripture}")
-        if reflection:
-            add(lines, f"\n✍️ {reflection}")
-        if declaration:
-            add(lines, f"\n💬 {declaration}")
-        if blessing:
-            add(lines, f"\n🕊️ {blessing}")
-        add(lines, f"\n🙏 {(morning_pr if mode == 'morning' else night_pr) or ('Lord, order my steps today. Amen.' if mode == 'morning' else 'Lord, quiet my mind and keep me in Your care. Amen.')}")
-        if promo_url:
-            add(lines, f"\n{promo_label}\n{promo_url}")
+        slot_prayer = morning_pr if mode == "morning" else night_pr
+        lines.extend(filter(None, (
+            theme_or_title and f"\n*{theme_or_title}*",
+            scripture and f"\n📖 {scripture}",
+            reflection and f"\n✍️ {reflection}",
+            declaration and f"\n💬 {declaration}",
+            blessing and f"\n🕊️ {blessing}",
+            f"\n🙏 {slot_prayer or default_prayer}",
+        )))
 
     else:
         verse_only = entry.get("verse")
         note_only = entry.get("note")
-        if verse_only:
-            add(lines, f"\n📖 {verse_only}")
-        if note_only:
-            add(lines, f"\n✍️ {note_only}")
-        add(lines, f"\n🙏 {'Lord, order my steps today. Amen.' if mode == 'morning' else 'Lord, quiet my mind and keep me in Your care. Amen.'}")
-        if promo_url:
-            add(lines, f"\n{promo_label}\n{promo_url}")
+        lines.extend(filter(None, (
+            verse_only and f"\n📖 {verse_only}",
+            note_only and f"\n✍️ {note_only}",
+            f"\n🙏 {default_prayer}",
+        )))
+
+    if _PROMO_BLOCK:
+        lines.append(_PROMO_BLOCK)
 
     msg = "\n".join(lines).strip()
     if len(msg) > MAX_RECOMMENDED_CHARS:
@@ -212,14 +297,14 @@ def fallback_message(mode: str, dt: datetime) -> str:
     base = (
         f"🌅 Good morning! {date_line}\n\n"
         "“This is the day the Lord has made; we will rejoice and be glad in it.” (Ps 118:24)\n\n"
-        "Lord, order my steps today. Amen."
+        f"{_DEFAULT_MORNING_PRAYER}"
     ) if mode == "morning" else (
         f"🌙 Good night! {date_line}\n\n"
         "“In peace I will lie down and sleep…” (Ps 4:8)\n\n"
-        "Lord, quiet my mind and keep me in Your care. Amen."
+        f"{_DEFAULT_NIGHT_PRAYER}"
     )
-    if SITE_URL:
-        base += f"\n\n🔗 Visit our website\n{SITE_URL}"
+    if _PROMO_BLOCK:
+        base += "\n" + _PROMO_BLOCK
     return base
 
 def get_message_from_json(mode: str, dt: datetime) -> str:
@@ -236,7 +321,7 @@ def get_message_from_json(mode: str, dt: datetime) -> str:
             return fallback_message(mode, dt)
 
         iso_today = dt.strftime("%Y-%m-%d")
-        entry = parse_today_entry(data, iso_today)
+        entry = parse_today_entry(data, iso_today, json_path)
         if entry:
             msg = build_message_from_entry(mode, entry, dt).strip()
             if msg:
@@ -275,7 +360,7 @@ def get_message_from_json(mode: str, dt: datetime) -> str:
     return fallback_message("morning", dt)
 
 def ensure_autogui():
-    if platform.system().lower() not in ("windows", "darwin"):
+    if _system_name() not in ("windows", "darwin"):
         print("[Error] Desktop automation is only supported on Windows/macOS.")
         sys.exit(2)
     try:
@@ -288,23 +373,25 @@ def ensure_autogui():
         sys.exit(2)
 
 
-def quick_search_chat(pyautogui, chat: str) -> None:
+def quick_search_chat(pyautogui, pyperclip, chat: str) -> None:
     """
     Use WhatsApp Web quick search to jump to a chat by name.
     Ctrl/Cmd+K is the current quick search; fallback to Ctrl/Cmd+F.
+    The name is pasted from the clipboard rather than typed key by key.
     """
     print(f"[Info] Selecting chat: {chat!r}")
-    meta_key = "command" if is_macos() else "ctrl"
+    mod = meta_key()
+    pyperclip.copy(chat)
     try:
-        pyautogui.hotkey(meta_key, "k")
+        pyautogui.hotkey(mod, "k")
         time.sleep(0.2)
-        pyautogui.typewrite(chat, interval=0.02)
+        pyautogui.hotkey(mod, "v")
         time.sleep(0.6)
         pyautogui.press("enter")
     except Exception:
-        pyautogui.hotkey(meta_key, "f")
+        pyautogui.hotkey(mod, "f")
         time.sleep(0.2)
-        pyautogui.typewrite(chat, interval=0.02)
+        pyautogui.hotkey(mod, "v")
         time.sleep(0.6)
         pyautogui.press("down")
         pyautogui.press("enter")
@@ -320,13 +407,19 @@ def do_paste(text: str, paste_delay: int, auto_send: bool) -> None:
         time.sleep(paste_delay)
 
     # Paste
-    meta_key = "command" if is_macos() else "ctrl"
-    pyautogui.hotkey(meta_key, "v")
+    mod = meta_key()
+    pyautogui.hotkey(mod, "v")
     time.sleep(0.15)
 
     if auto_send:
         pyautogui.press("enter")
 
+def exit_now(code: int = 0) -> None:
+    """Flush output and exit without interpreter teardown (atexit, gc)."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Open WhatsApp Web and paste SoulStart message (morning/night/verses)."
@@ -355,19 +448,19 @@ def main() -> None:
 
     # Safety: never auto-send without an explicit --send
     if args.dry_run:
-        print("\n----- DRY RUN: WhatsApp message preview -----\n")
-        print(msg)
-        print("\n----- END PREVIEW -----\n")
-        sys.exit(0)
+        preview = f"\n----- DRY RUN: WhatsApp message preview -----\n\n{msg}\n\n----- END PREVIEW -----\n\n"
+        # One write on the text layer, so newline translation matches the [Info] lines
+        sys.stdout.write(preview)
+        exit_now(0)
 
     # Open WhatsApp Web
     open_web()
     if args.open_only:
-        sys.exit(0)
+        exit_now(0)
 
     # Optional: aim the chat before pasting
     if args.chat:
-        pyautogui, _ = ensure_autogui()
+        pyautogui, pyperclip = ensure_autogui()
 
         # Wait for WA UI to settle
         time.sleep(2)
@@ -376,7 +469,7 @@ def main() -> None:
         pyautogui.click(300, 600)
         time.sleep(0.5)
 
-        quick_search_chat(pyautogui, args.chat)
+        quick_search_chat(pyautogui, pyperclip, args.chat)
 
     do_paste(msg, args.paste_delay, args.send)
     print("✅ Message pasted" + (" and sent." if args.send else ". (Press Enter to send)"))
@@ -0,0 +1,64 @@
+"""
+_docx_common.py
+
+DOCX reading shared by tools/ingest.py and tools/import_studies.py: streams
+body paragraph text straight from word/document.xml with lxml instead of
+building python-docx's Document/Paragraph object tree.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+try:
+    from lxml import etree  # pip install lxml (also installed with python-docx)
+except ImportError as e:
+    raise SystemExit("Missing dependency: lxml. Install with: pip install lxml") from e
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY, W_P, W_R, W_T, W_BR, W_TBL, W_HYPERLINK = (
+    W + "body", W + "p", W + "r", W + "t", W + "br", W + "tbl", W + "hyperlink"
+)
+# Other run children that python-docx renders as text
+RUN_TEXT = {W + "tab": "\t", W + "ptab": "\t", W + "cr": "\n", W + "noBreakHyphen": "-"}
+
+
+def _run_text(r) -> str:
+    parts = []
+    for e in r:
+        if e.tag == W_T:
+            parts.append(e.text or "")
+        elif e.tag == W_BR:
+            # page/column breaks carry no text, line breaks are newlines
+            parts.append("\n" if e.get(W + "type", "textWrapping") == "textWrapping" else "")
+        else:
+            parts.append(RUN_TEXT.get(e.tag, ""))
+    return "".join(parts)
+
+
+def iter_docx_paragraphs(docx_path: Path) -> Iterator[str]:
+    """
+    Yield the text of each body paragraph, matching python-docx's
+    doc.paragraphs / Paragraph.text: table cells are skipped, only direct
+    and hyperlink runs count, tabs and line breaks become whitespace.
+    """
+    with zipfile.ZipFile(docx_path) as z, z.open("word/document.xml") as f:
+        for _, el in etree.iterparse(f, events=("end",), tag=(W_P, W_TBL)):
+            parent = el.getparent()
+            if parent is None or parent.tag != W_BODY:
+                continue  # table-cell paragraphs are not body paragraphs
+            if el.tag == W_P:
+                parts = []
+                for c in el:
+                    if c.tag == W_R:
+                        parts.append(_run_text(c))
+                    elif c.tag == W_HYPERLINK:
+                        parts.extend(_run_text(r) for r in c.iterchildren(W_R))
+                yield "".join(parts)
+            # Drop finished body elements so long documents stay flat in memory
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
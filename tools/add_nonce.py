@@ -10,21 +10,23 @@ Usage:
   python tools/add_nonce.py
 """
 
+import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
 
-# Regex: matches <script ...> ... </script> without src=
-SCRIPT_TAG_RE = re.compile(
-    r'(<script\b(?![^>]*\bsrc=)[^>]*)(>)',
-    flags=re.IGNORECASE
-)
-# Regex: matches <style ...> ... </style> (style never uses href= in HTML)
-STYLE_TAG_RE = re.compile(
-    r'(<style\b[^>]*)(>)',
+# Regex: matches opening <script ...> without src= or <style ...>
+# (style never uses href= in HTML), so one pass covers both tag kinds
+INLINE_TAG_RE = re.compile(
+    r'(<(?:script\b(?![^>]*\bsrc=)|style\b)[^>]*)(>)',
     flags=re.IGNORECASE
 )
+# Only these files are treated as Jinja/HTML templates
+TEMPLATE_SUFFIXES = {".html", ".jinja", ".jinja2"}
+
 # Detect existing nonce attribute
 NONCE_ATTR_RE = re.compile(r'\bnonce\s*=\s*["\']', flags=re.IGNORECASE)
 
@@ -36,24 +38,30 @@ def add_nonce_to_tag(match):
     return f'{start} nonce="{{{{ csp_nonce() }}}}"{end}'
 
 def process_file(path: Path):
+    # Only consider files that look like Jinja/HTML (checked before reading)
+    if path.suffix.lower() not in TEMPLATE_SUFFIXES:
+        return False, "skip_ext"
+
     orig = path.read_text(encoding="utf-8")
     out = orig
 
-    # Only consider files that look like Jinja/HTML
-    if path.suffix.lower() not in {".html", ".jinja", ".jinja2"}:
-        return False, "skip_ext"
-
-    # Add nonce to inline <script> (no src=)
-    out = SCRIPT_TAG_RE.sub(add_nonce_to_tag, out)
-    # Add nonce to <style> (always inline in templates)
-    out = STYLE_TAG_RE.sub(add_nonce_to_tag, out)
+    # Add nonce to inline <script> (no src=) and <style> in a single scan
+    out = INLINE_TAG_RE.sub(add_nonce_to_tag, out)
 
     if out != orig:
-        # Backup once
+        # Backup once: hardlink the original instead of copying its bytes
         bak = path.with_suffix(path.suffix + ".bak")
         if not bak.exists():
-            bak.write_text(orig, encoding="utf-8")
-        path.write_text(out, encoding="utf-8")
+            try:
+                os.link(path, bak)
+            except OSError:  # no hardlinks on this filesystem
+                bak.write_bytes(path.read_bytes())
+        # Write a new file and swap it in; rewriting in place would also
+        # rewrite the hardlinked backup, which shares the original's inode
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(out, encoding="utf-8")
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
         return True, "updated"
     return False, "nochange"
 
@@ -62,9 +70,13 @@ def main():
         print(f"Templates folder not found: {TEMPLATES_DIR}")
         return
     changed = 0
-    for p in TEMPLATES_DIR.rglob("*"):
-        if p.is_file():
-            did, status = process_file(p)
+    # Suffix first: skips images, PDFs and .bak backups without a stat
+    files = [p for p in TEMPLATES_DIR.rglob("*")
+             if p.suffix.lower() in TEMPLATE_SUFFIXES and p.is_file()]
+    # Files are independent and the work is mostly disk I/O, so overlap it;
+    # map() keeps results (and the log) in walk order
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for p, (did, status) in zip(files, ex.map(process_file, files)):
             if did:
                 changed += 1
                 print(f"[nonce] updated: {p.relative_to(TEMPLATES_DIR)}")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+DOCX → JSON + CSV converter for SoulStart Devotion.
+Also provides a callable function `import_studies()` for Flask admin use.
+"""
+
+from __future__ import annotations
+import re, json, csv
+from pathlib import Path
+from typing import List, Dict, Any
+
+try:
+    import orjson  # optional: much faster JSON encode
+except ImportError:
+    orjson = None
+
+from _docx_common import iter_docx_paragraphs
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEV_DIR  = BASE_DIR / "devotions"
+DOCX_PATH = BASE_DIR / "Week1_Devotion.docx"
+JSON_OUT  = DEV_DIR / "studies.json"
+CSV_OUT   = DEV_DIR / "studies.csv"
+
+STUDY_RE = re.compile(r"^\s*(?:day\s*(\d+)\s*[:.\-]\s*|(\d+)\s*[\.\)\-:]\s*)(.*)$", re.I)
+SCRIPTURE_RE = re.compile(r"^\s*(?:scripture|verse|text)\s*:\s*(.+)$", re.I)
+BULLET_RE = re.compile(r"^\s*(?:[-*•–]|(\d+)[\.\)])\s+(.*)$")
+
+def _norm(s:str)->str: return " ".join((s or "").split())
+
+def _parse_docx(path: Path) -> List[Dict[str, Any]]:
+    studies, cur, outline, points = [], None, [], []
+    def flush():
+        if not cur: return
+        cur["outline"] = _norm(" ".join(outline))
+        cur["points"] = [p for p in points if p]
+        cur.setdefault("resources", [])
+        studies.append(cur.copy())
+
+    for text in iter_docx_paragraphs(path):
+        t = _norm(text)
+        if not t: continue
+        m = STUDY_RE.match(t)
+        if m:
+            flush(); outline, points = [], []
+            cur = {"title": _norm(m.group(3) or f"Study {m.group(1) or m.group(2)}"),
+                   "scripture": "", "outline":"", "points":[], "resources":[]}
+            continue
+        if not cur: cur = {"title":"Study","scripture":"","outline":"","points":[],"resources":[]}
+        m = SCRIPTURE_RE.match(t)
+        if m: cur["scripture"] = _norm(m.group(1)); continue
+        m = BULLET_RE.match(t)
+        if m: points.append(_norm(m.group(2))); continue
+        outline.append(t)
+    flush(); return studies
+
+def _write_json(data, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None: path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2)); return
+    with path.open("w",encoding="utf-8") as f: json.dump(data,f,ensure_ascii=False,indent=2)
+
+def _write_csv(data, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    keys = ["title","scripture","outline","points"]
+    with path.open("w",encoding="utf-8",newline="") as f:
+        w = csv.DictWriter(f, fieldnames=keys, extrasaction="ignore")  # no resources column
+        w.writeheader()
+        for d in data:
+            row = d.copy()
+            row["points"] = "; ".join(d.get("points",[]))
+            w.writerow(row)
+
+def import_studies(docx: Path = DOCX_PATH) -> List[Dict[str, Any]]:
+    """Callable for Flask admin route."""
+    data = _parse_docx(docx)
+    _write_json(data, JSON_OUT)
+    _write_csv(data, CSV_OUT)
+    print(f"✅ Imported {len(data)} studies → {JSON_OUT.name} & {CSV_OUT.name}")
+    return data
+
+if __name__ == "__main__":
+    import_studies()
@@ -20,9 +20,11 @@ from pathlib import Path
 from typing import List, Dict, Any
 
 try:
-    from docx import Document  # pip install python-docx
-except ImportError as e:
-    raise SystemExit("Missing dependency: python-docx. Install with: pip install python-docx") from e
+    import orjson  # optional: much faster JSON encode
+except ImportError:
+    orjson = None
+
+from _docx_common import iter_docx_paragraphs
 
 
 # --- Paths (project-root aware) ---
@@ -31,39 +33,24 @@ DEFAULT_DOCX = BASE_DIR / "Week1_Devotion.docx"
 DEFAULT_OUT  = BASE_DIR / "devotions" / "studies.json"
 
 # --- Heuristics / regexes ---
-# Start-of-study markers: "1.", "1)", "1 -", "Day 1", "Day 1:"
-STUDY_START_RE = re.compile(
-    r"^\s*(?:day\s*(\d+)\s*[:.\-]\s*|(\d+)\s*[\.\)\-:]\s*)(.*)$",
+# One pattern classifies a paragraph; alternatives are tried in priority order
+# and m.lastgroup names the branch that matched:
+#   study -> start-of-study markers: "1.", "1)", "1 -", "Day 1", "Day 1:"
+#   scr   -> scripture lines ("Scripture:", "Verse:", "Text:")
+#   bul   -> bullets or numbered points within a study
+CLASSIFIER = re.compile(
+    r"(?P<study>^\s*(?:day\s*(?P<day>\d+)\s*[:.\-]\s*|(?P<num>\d+)\s*[\.\)\-:]\s*)(?P<tail>.*)$)"
+    r"|(?P<scr>^\s*(?:scripture|verse|text)\s*:\s*(?P<ref>.+)$)"
+    r"|(?P<bul>^\s*(?:[-*•–]|\d+[\.\)])\s+(?P<point>.*)$)",
     flags=re.IGNORECASE
 )
 
-SCRIPTURE_RE = re.compile(r"^\s*(?:scripture|verse|text)\s*:\s*(.+)$", re.IGNORECASE)
-
-# Bullets or numbered points within a study
-BULLET_RE = re.compile(r"^\s*(?:[-*•–]|(\d+)[\.\)])\s+(.*)$")
-
-# Cleaners
-WS_RE = re.compile(r"\s+")
-
-
 def _norm_ws(s: str) -> str:
     """Normalize whitespace and strip."""
-    return WS_RE.sub(" ", s or "").strip()
-
-
-def _is_heading(p_text: str) -> bool:
-    """Does this paragraph start a new study?"""
-    return bool(STUDY_START_RE.match(p_text))
-
-
-def _maybe_scripture(p_text: str) -> str | None:
-    """Extract scripture text if the paragraph looks like a Scripture line."""
-    m = SCRIPTURE_RE.match(p_text)
-    return _norm_ws(m.group(1)) if m else None
+    return " ".join((s or "").split())
 
 
 def parse_docx(docx_path: Path) -> List[Dict[str, Any]]:
-    doc = Document(str(docx_path))
     studies: List[Dict[str, Any]] = []
 
     cur: Dict[str, Any] | None = None
@@ -87,25 +74,26 @@ def parse_docx(docx_path: Path) -> List[Dict[str, Any]]:
         cur.setdefault("resources", [])
         studies.append(cur.copy())
 
-    for para in doc.paragraphs:
-        raw = (para.text or "").strip()
+    for para_text in iter_docx_paragraphs(docx_path):
+        raw = para_text.strip()
         if not raw:
             continue
 
         text = _norm_ws(raw)
+        m = CLASSIFIER.match(text)
+        kind = m.lastgroup if m else None
 
         # New study heading?
-        if _is_heading(text):
+        if kind == "study":
             # flush previous
             push_current()
             outline_parts = []
             points = []
 
-            m = STUDY_START_RE.match(text)
-            # Extract the trailing title part (group 3) if present
-            title_tail = _norm_ws(m.group(3) or "")
+            # Extract the trailing title part if present
+            title_tail = _norm_ws(m.group("tail") or "")
             cur = {
-                "title": title_tail or f"Study {m.group(1) or m.group(2)}",
+                "title": title_tail or f"Study {m.group('day') or m.group('num')}",
                 "scripture": "",
                 "outline": "",
                 "points": [],
@@ -120,16 +108,14 @@ def parse_docx(docx_path: Path) -> List[Dict[str, Any]]:
             points = []
 
         # Scripture line?
-        scr = _maybe_scripture(text)
-        if scr:
-            cur["scripture"] = scr
+        if kind == "scr":
+            cur["scripture"] = _norm_ws(m.group("ref"))
             continue
 
         # Bullet/numbered point?
-        b = BULLET_RE.match(text)
-        if b:
+        if kind == "bul":
             # prefer the text portion after bullet
-            pt = b.group(2) if b.group(2) else text
+            pt = m.group("point") or text
             points.append(_norm_ws(pt))
             continue
 
@@ -161,8 +147,11 @@ def normalize_for_app(studies: List[Dict[str, Any]], limit: int | None = 6) -> L
 
 def write_json(data: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"✅ Wrote {path} with {len(data) if isinstance(data, list) else 'N'} studies")
 
 
@@ -193,78 +182,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-#!/usr/bin/env python3
-"""
-DOCX → JSON + CSV converter for SoulStart Devotion.
-Also provides a callable function `import_studies()` for Flask admin use.
-"""
-
-from __future__ import annotations
-import re, json, csv
-from pathlib import Path
-from typing import List, Dict, Any
-from docx import Document
-
-BASE_DIR = Path(__file__).resolve().parents[1]
-DEV_DIR  = BASE_DIR / "devotions"
-DOCX_PATH = BASE_DIR / "Week1_Devotion.docx"
-JSON_OUT  = DEV_DIR / "studies.json"
-CSV_OUT   = DEV_DIR / "studies.csv"
-
-STUDY_RE = re.compile(r"^\s*(?:day\s*(\d+)\s*[:.\-]\s*|(\d+)\s*[\.\)\-:]\s*)(.*)$", re.I)
-SCRIPTURE_RE = re.compile(r"^\s*(?:scripture|verse|text)\s*:\s*(.+)$", re.I)
-BULLET_RE = re.compile(r"^\s*(?:[-*•–]|(\d+)[\.\)])\s+(.*)$")
-
-def _norm(s:str)->str: return re.sub(r"\s+"," ",s or "").strip()
-
-def _parse_docx(path: Path) -> List[Dict[str, Any]]:
-    doc = Document(str(path))
-    studies, cur, outline, points = [], None, [], []
-    def flush():
-        if not cur: return
-        cur["outline"] = _norm(" ".join(outline))
-        cur["points"] = [p for p in points if p]
-        cur.setdefault("resources", [])
-        studies.append(cur.copy())
-
-    for p in doc.paragraphs:
-        t = _norm(p.text)
-        if not t: continue
-        if STUDY_RE.match(t):
-            flush(); outline, points = [], []
-            m = STUDY_RE.match(t)
-            cur = {"title": _norm(m.group(3) or f"Study {m.group(1) or m.group(2)}"),
-                   "scripture": "", "outline":"", "points":[], "resources":[]}
-            continue
-        if not cur: cur = {"title":"Study","scripture":"","outline":"","points":[],"resources":[]}
-        if SCRIPTURE_RE.match(t): cur["scripture"] = _norm(SCRIPTURE_RE.match(t).group(1)); continue
-        if BULLET_RE.match(t): points.append(_norm(BULLET_RE.match(t).group(2))); continue
-        outline.append(t)
-    flush(); return studies
-
-def _write_json(data, path: Path):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w",encoding="utf-8") as f: json.dump(data,f,ensure_ascii=False,indent=2)
-
-def _write_csv(data, path: Path):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    keys = ["title","scripture","outline","points"]
-    with path.open("w",encoding="utf-8",newline="") as f:
-        w = csv.DictWriter(f, fieldnames=keys)
-        w.writeheader()
-        for d in data:
-            row = d.copy()
-            row["points"] = "; ".join(d.get("points",[]))
-            w.writerow(row)
-
-def import_studies(docx: Path = DOCX_PATH) -> List[Dict[str, Any]]:
-    """Callable for Flask admin route."""
-    data = _parse_docx(docx)
-    _write_json(data, JSON_OUT)
-    _write_csv(data, CSV_OUT)
-    print(f"✅ Imported {len(data)} studies → {JSON_OUT.name} & {CSV_OUT.name}")
-    return data
-
-if __name__ == "__main__":
-    import_studies()
@@ -4,6 +4,7 @@ SoulStart Sunset video generator (with sign-language PIP).
 - Reads JSON: devotions/September/SoulStart_Sunset_Sep.json
 - Outputs: videos/sunset_YYYY-MM-DD.mp4 + .srt
 - MoviePy 2.x compatible (with_* / subclipped / resized)
+- --renderer ffmpeg: slides written once as PNGs, composited/encoded by ffmpeg
 
 Install:
   pip install moviepy pillow imageio[ffmpeg] numpy
@@ -12,13 +13,22 @@ Install:
 import os
 import json
 import argparse
-import math
+import functools
+import itertools
+import subprocess
+import tempfile
 from datetime import datetime, date
 from zoneinfo import ZoneInfo
 import numpy as np
-from moviepy import ColorClip, ImageClip, VideoFileClip, CompositeVideoClip, concatenate_videoclips
+from moviepy import ColorClip, ImageClip, VideoFileClip, CompositeVideoClip, concatenate_videoclips, vfx
+from moviepy.config import FFMPEG_BINARY
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit  # optional: compiles the line-packing loop
+except ImportError:
+    njit = None
+
 # ---------- CONFIG ----------
 TZ = ZoneInfo("America/Nassau")
 W, H = 1920, 1080
@@ -27,12 +37,25 @@ BG_COLOR = (9, 16, 28)        # deep navy
 PANEL = (245, 248, 252)       # light panel
 INK = (31, 41, 55)            # text color
 
+# Hardware H.264 encoders and the rate-control flags they need; anything
+# else is handed to ffmpeg as-is.
+HW_CODEC_PARAMS = {
+    "h264_nvenc": ["-rc", "vbr", "-cq", "23"],
+    "h264_videotoolbox": [],
+}
+
+# Static background as one pre-materialized frame shared by every slide
+BG_FRAME = np.full((H, W, 3), BG_COLOR, dtype=np.uint8)
+
 FONT_PATHS = [
     r"C:\Windows\Fonts\arial.ttf",
     r"/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
     r"/System/Library/Fonts/Supplemental/Arial.ttf",
 ]
 
+# Probe the disk once at import; find_font only tries fonts that exist
+_FONT_CANDIDATES = [p for p in FONT_PATHS if os.path.exists(p)]
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_JSON = os.path.join(BASE_DIR, "devotions", "September", "SoulStart_Sunset_Sep.json")
 STATIC_DIR = os.path.join(BASE_DIR, "static")
@@ -45,30 +68,58 @@ OUT_DIR = os.path.join(BASE_DIR, "videos")
 os.makedirs(OUT_DIR, exist_ok=True)
 
 # ---------- HELPERS ----------
+@functools.lru_cache(maxsize=32)  # one font object per size
 def find_font(size=64):
-    for p in FONT_PATHS:
-        if os.path.exists(p):
-            try:
-                return ImageFont.truetype(p, size=size)
-            except Exception:
-                continue
+    for p in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(p, size=size)
+        except Exception:
+            continue
     return ImageFont.load_default()
 
+# Measured widths per (font, text); common words recur across every panel.
+# Keyed by the font object itself so it stays alive and its key stays valid.
+_GL_CACHE: dict = {}
+
+def getlen(font, s):
+    k = (font, s)
+    v = _GL_CACHE.get(k)
+    if v is None:
+        v = _GL_CACHE[k] = font.getlength(s)
+    return v
+
+def _pack_lines(widths, space_w, max_width):
+    """Greedy line breaks over word widths -> [(start, end), ...] word spans."""
+    spans = []
+    start, cur = 0, 0.0
+    for i in range(len(widths)):
+        add = widths[i] if i == start else space_w + widths[i]
+        if cur + add <= max_width:
+            cur += add
+        else:
+            if i > start:
+                spans.append((start, i))
+            start, cur = i, widths[i]
+    if len(widths) > start:
+        spans.append((start, len(widths)))
+    return spans
+
+if njit is not None:
+    _pack_lines = njit(cache=True, nogil=True)(_pack_lines)
+
 def wrap_text(text, font, max_width):
+    # Measure each word once, then pack lines from the widths alone
+    space_w = getlen(font, " ")
     lines = []
     for para in text.split("\n"):
         if not para.strip():
             lines.append("")
             continue
-        words, current = para.split(), ""
-        for w in words:
-            trial = (current + " " + w).strip()
-            if font.getlength(trial) <= max_width:
-                current = trial
-            else:
-                if current: lines.append(current)
-                current = w
-        if current: lines.append(current)
+        words = para.split()
+        widths = [getlen(font, w) for w in words]
+        if njit is not None:
+            widths = np.array(widths, dtype=np.float64)
+        lines.extend(" ".join(words[s:e]) for s, e in _pack_lines(widths, space_w, float(max_width)))
     return lines
 
 def render_panel(text, title=None, subtitle=None, width=W-320, padding=40, title_size=70, text_size=52):
@@ -76,32 +127,45 @@ def render_panel(text, title=None, subtitle=None, width=W-320, padding=40, title
     sub_font   = find_font(36)
     body_font  = find_font(text_size)
 
+    # (font, fill, line advance) per kind, resolved once per panel
+    title_style = (title_font, INK, title_font.size + 10)
+    sub_style   = (sub_font, (75, 85, 99), sub_font.size + 8)
+    body_style  = (body_font, INK, body_font.size + 8)
+
     inner_w = width - padding*2
     lines = []
-    if title:    lines.append(("title", title))
-    if subtitle: lines.append(("sub", subtitle))
-    for line in wrap_text(text, body_font, inner_w):
-        lines.append(("body", line))
+    if title:    lines.append((title, title_style))
+    if subtitle: lines.append((subtitle, sub_style))
+    lines.extend((line, body_style) for line in wrap_text(text, body_font, inner_w))
 
-    est_h = padding*2
-    for kind, _ in lines:
-        est_h += (title_font.size + 10) if kind=="title" else (sub_font.size + 8 if kind=="sub" else body_font.size + 8)
+    est_h = padding*2 + sum(style[2] for _, style in lines)
 
     img = Image.new("RGB", (width, est_h), PANEL)
     draw = ImageDraw.Draw(img)
     x, y = padding, padding
-    for kind, ln in lines:
-        if kind=="title":
-            draw.text((x, y), ln, font=title_font, fill=INK); y += title_font.size + 10
-        elif kind=="sub":
-            draw.text((x, y), ln, font=sub_font, fill=(75, 85, 99)); y += sub_font.size + 8
-        else:
-            draw.text((x, y), ln, font=body_font, fill=INK); y += body_font.size + 8
+    for ln, (font, fill, step) in lines:
+        draw.text((x, y), ln, font=font, fill=fill); y += step
     return img
 
+def slide_frame(panel):
+    # Bake the centered panel into a copy of the background once, so the
+    # slide is a single static frame instead of a per-frame composite.
+    arr = BG_FRAME.copy()
+    ph, pw = panel.shape[:2]
+    y, x = (H - ph) // 2, (W - pw) // 2
+    # Panels taller/wider than the frame are center-cropped, as compositing did
+    sy, sx = max(0, -y), max(0, -x)
+    y, x = max(0, y), max(0, x)
+    h, w = min(ph - sy, H - y), min(pw - sx, W - x)
+    arr[y:y+h, x:x+w] = panel[sy:sy+h, sx:sx+w]
+    return arr
+
+def static_slide(panel, dur):
+    return ImageClip(slide_frame(panel)).with_duration(dur)
+
 def text_panel_clip(text, title=None, subtitle=None, dur=6.0):
-    frame = np.array(render_panel(text=text, title=title, subtitle=subtitle))
-    return ImageClip(frame).with_duration(dur)
+    panel = np.array(render_panel(text=text, title=title, subtitle=subtitle))
+    return static_slide(panel, dur)
 
 def dur_for(text, base=4.5, per_char=0.028, min_d=4.0, max_d=14.0):
     est = base + len(text)*per_char
@@ -119,27 +183,31 @@ def pick_entry(entries, day_iso):
         if x.get("date") == day_iso:
             return x
     try:
+        target = datetime.fromisoformat(day_iso).date()
         dated = [x for x in entries if x.get("date")]
-        dated.sort(key=lambda x: abs((datetime.fromisoformat(x["date"]).date()
-                                      - datetime.fromisoformat(day_iso).date()).days))
-        return dated[0] if dated else (entries[0] if entries else None)
+        if not dated:
+            return entries[0] if entries else None
+        return min(dated, key=lambda x: abs((datetime.fromisoformat(x["date"]).date() - target).days))
     except Exception:
         return entries[0] if entries else None
 
-def sign_pip(sign_path, total_dur):
+@functools.lru_cache(maxsize=8)  # with_* returns copies, so sharing is safe
+def pip_border(w, h, total_dur):
+    return ColorClip((w + 16, h + 16), color=(255,255,255)).with_duration(total_dur)
+
+def sign_source(sign_path):
     src_mp4 = sign_path if (sign_path and os.path.exists(sign_path)) else (
               DEFAULT_SIGN_MP4 if os.path.exists(DEFAULT_SIGN_MP4) else None)
     src_img = DEFAULT_SIGN_IMG if os.path.exists(DEFAULT_SIGN_IMG) else None
+    return src_mp4, src_img
+
+def sign_pip(sign_path, total_dur):
+    src_mp4, src_img = sign_source(sign_path)
 
     if src_mp4:
-        v = VideoFileClip(src_mp4)
-        if v.duration >= total_dur:
-            v = v.subclipped(0, total_dur)
-        else:
-            loops = max(1, math.ceil(total_dur / max(v.duration, 0.1)))
-            v = concatenate_videoclips([v]*loops).subclipped(0, total_dur)
-        v = v.resized(height=360)
-        border = ColorClip((int(v.w)+16, int(v.h)+16), color=(255,255,255)).with_duration(total_dur)
+        # Loop wraps time back into the one reader instead of chaining copies
+        v = VideoFileClip(src_mp4).resized(height=360).with_effects([vfx.Loop(duration=total_dur)])
+        border = pip_border(int(v.w), int(v.h), total_dur)
         return CompositeVideoClip(
             [border.with_position(("right","bottom")), v.with_position(("right","bottom"))],
             size=(W,H)
@@ -147,7 +215,7 @@ def sign_pip(sign_path, total_dur):
 
     if src_img:
         img = ImageClip(src_img).resized(height=360).with_duration(total_dur)
-        border = ColorClip((int(img.w)+16, int(img.h)+16), color=(255,255,255)).with_duration(total_dur)
+        border = pip_border(int(img.w), int(img.h), total_dur)
         return CompositeVideoClip(
             [border.with_position(("right","bottom")), img.with_position(("right","bottom"))],
             size=(W,H)
@@ -169,23 +237,106 @@ def sec_to_srt(ts):
     h = int(ts // 3600); m = int((ts % 3600) // 60); s = int(ts % 60); ms = int((ts - int(ts)) * 1000)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
-def make_srt(path, clips, texts):
-    t, lines = 0.0, []
-    for i, clip in enumerate(clips, start=1):
-        start, end = t, t + clip.duration
-        caption = texts[i-1][1]
-        lines.append(f"{i}\n{sec_to_srt(start)} --> {sec_to_srt(end)}\n{caption}\n")
-        t = end
+def make_srt(path, durations, texts):
+    ends = list(itertools.accumulate(durations))
+    starts = [0.0] + ends[:-1]
+    lines = [f"{i}\n{sec_to_srt(start)} --> {sec_to_srt(end)}\n{caption}\n"
+             for i, (start, end, (_, caption)) in enumerate(zip(starts, ends, texts), start=1)]
     with open(path, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
 
+def write_mp4(clip, path, codec="libx264", preset="medium"):
+    params = HW_CODEC_PARAMS.get(codec)
+    if params is not None:
+        try:
+            clip.write_videofile(path, fps=FPS, codec=codec, audio=False, threads=4,
+                                 preset=preset, ffmpeg_params=params)
+            return codec
+        except (IOError, OSError) as e:
+            print(f"⚠️ {codec} not usable here ({e.__class__.__name__}); falling back to libx264")
+            codec = "libx264"
+    clip.write_videofile(path, fps=FPS, codec=codec, audio=False, threads=4, preset=preset)
+    return codec
+
+def render_moviepy(slides, sign_path, out_mp4, codec="libx264", preset="medium"):
+    clips = [text_panel_clip(text, title=title, subtitle=sub, dur=dur) for text, title, sub, dur in slides]
+    base = concatenate_videoclips(clips, method="compose")
+    total = base.duration
+
+    sign_clip = sign_pip(sign_path, total)
+    logos = logo_strip()
+
+    final = CompositeVideoClip([base, sign_clip] + logos, size=(W, H))
+    return write_mp4(final, out_mp4, codec=codec, preset=preset)
+
+def render_ffmpeg(slides, sign_path, out_mp4, codec="libx264", preset="medium"):
+    # Same layout as render_moviepy, but each slide is written once as a PNG
+    # and ffmpeg loops/overlays/encodes it; no frames pass through Python.
+    total = sum(s[3] for s in slides)
+    src_mp4, src_img = sign_source(sign_path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # concat.txt lists bare names, which the demuxer resolves next to the
+        # list file, so quotes in the temp dir path can't break its quoting
+        concat = []
+        for i, (text, title, sub, dur) in enumerate(slides, start=1):
+            name = f"slide_{i}.png"
+            panel = np.array(render_panel(text=text, title=title, subtitle=sub))
+            Image.fromarray(slide_frame(panel)).save(os.path.join(tmp, name), compress_level=1)
+            concat.append(f"file '{name}'\nduration {dur:.3f}")
+        # The concat demuxer drops the last duration unless the file is listed again
+        concat.append(f"file '{name}'")
+        list_path = os.path.join(tmp, "concat.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(concat) + "\n")
+
+        inputs = ["-f", "concat", "-safe", "0", "-i", list_path]
+        graph = [f"[0:v]fps={FPS}[v0]"]
+        n, last = 1, "v0"
+
+        # Sign PIP: 360px high, 16px white border top/left, bottom-right corner
+        if src_mp4 or src_img:
+            inputs += ["-stream_loop", "-1", "-i", src_mp4] if src_mp4 else ["-loop", "1", "-i", src_img]
+            graph.append(f"[{n}:v]scale=-2:360,pad=iw+16:ih+16:16:16:white[pip]")
+            graph.append(f"[{last}][pip]overlay=W-w:H-h:shortest=1[v{n}]")
+            n, last = n + 1, f"v{n}"
+
+        # Logos: 70px high along the top-left, as in logo_strip
+        x = 36
+        for logo in (SOULSTART_LOGO, SSCM_LOGO):
+            if not os.path.exists(logo):
+                continue
+            with Image.open(logo) as im:
+                lw = round(im.width * 70 / im.height)
+            inputs += ["-i", logo]
+            graph.append(f"[{n}:v]scale={lw}:70[l{n}]")
+            graph.append(f"[{last}][l{n}]overlay={x}:16[v{n}]")
+            n, last = n + 1, f"v{n}"
+            x += lw + 24
+
+        def cmd(c):
+            return [FFMPEG_BINARY, "-y", "-loglevel", "error", *inputs,
+                    "-filter_complex", ";".join(graph), "-map", f"[{last}]",
+                    "-t", f"{total:.3f}", "-an", "-pix_fmt", "yuv420p",
+                    "-c:v", c, "-preset", preset, *HW_CODEC_PARAMS.get(c, []), out_mp4]
+
+        if codec in HW_CODEC_PARAMS:
+            if subprocess.run(cmd(codec)).returncode == 0:
+                return codec
+            print(f"⚠️ {codec} not usable here; falling back to libx264")
+            codec = "libx264"
+        subprocess.run(cmd(codec), check=True)
+        return codec
+
 # ---------- MAIN ----------
 def build_video(args):
     day = args.date or os.getenv("SOULSTART_DATE") or datetime.now(TZ).date().isoformat()
     day_iso = day.isoformat() if isinstance(day, date) else day
 
     entries = load_json(args.json)
-    entry = pick_entry(entries, day_iso)
+    # reversed() so the first entry for a date wins, as in pick_entry's scan
+    date_index = {e["date"]: e for e in reversed(entries) if e.get("date")}
+    entry = date_index.get(day_iso) or pick_entry(entries, day_iso)
     if not entry:
         raise SystemExit("No entry found in JSON.")
 
@@ -195,62 +346,24 @@ def build_video(args):
     prayer     = (entry.get("prayer") or "").strip()
     pretty_date = fmt_date(datetime.fromisoformat(entry.get("date", day_iso)).date())
 
-    bg = ColorClip((W, H), color=BG_COLOR)
-
-    # Slides
-    clips = []
-
-    # 1) Title
+    # Slides: (text, title, subtitle, duration)
     title_txt = f"🌙 SoulStart Sunset — {pretty_date}"
-    c1p = text_panel_clip("", title=title_txt, dur=3.5)
-    c1  = CompositeVideoClip(
-        [bg.with_duration(c1p.duration), c1p.with_position(("center","center"))],
-        size=(W,H)
-    )
-    clips.append(c1)
-
-    # 2) Scripture
     verse_full = f"“{verse_text}”"
     sub = verse_ref
-    d2 = dur_for(verse_text, base=5.5)
-    c2p = text_panel_clip(verse_full, title="📖 Scripture", subtitle=sub, dur=d2)
-    c2  = CompositeVideoClip(
-        [bg.with_duration(c2p.duration), c2p.with_position(("center","center"))],
-        size=(W,H)
-    )
-    clips.append(c2)
-
-    # 3) Reflection
-    d3 = dur_for(reflection, base=5.0)
-    c3p = text_panel_clip(reflection, title="🕊️ Reflection", dur=d3)
-    c3  = CompositeVideoClip(
-        [bg.with_duration(c3p.duration), c3p.with_position(("center","center"))],
-        size=(W,H)
-    )
-    clips.append(c3)
-
-    # 4) Prayer
-    d4 = dur_for(prayer, base=5.0)
-    c4p = text_panel_clip(prayer, title="✨ PRAYER", dur=d4)
-    c4  = CompositeVideoClip(
-        [bg.with_duration(c4p.duration), c4p.with_position(("center","center"))],
-        size=(W,H)
-    )
-    clips.append(c4)
-
-    base = concatenate_videoclips(clips, method="compose")
-    total = base.duration
-
-    sign_clip = sign_pip(args.sign, total)
-    logos = logo_strip()
+    slides = [
+        ("", title_txt, None, 3.5),                                          # 1) Title
+        (verse_full, "📖 Scripture", sub, dur_for(verse_text, base=5.5)),    # 2) Scripture
+        (reflection, "🕊️ Reflection", None, dur_for(reflection, base=5.0)),  # 3) Reflection
+        (prayer, "✨ PRAYER", None, dur_for(prayer, base=5.0)),              # 4) Prayer
+    ]
 
-    final = CompositeVideoClip([base, sign_clip] + logos, size=(W, H))
     out_mp4 = os.path.join(OUT_DIR, f"sunset_{entry.get('date', day_iso)}.mp4")
-    final.write_videofile(out_mp4, fps=FPS, codec="libx264", audio=False, threads=4, preset="medium")
+    render = render_ffmpeg if args.renderer == "ffmpeg" else render_moviepy
+    render(slides, args.sign, out_mp4, codec=args.codec, preset=args.preset)
 
     # SRT captions
     srt_path = os.path.join(OUT_DIR, f"sunset_{entry.get('date', day_iso)}.srt")
-    make_srt(srt_path, [c1, c2, c3, c4], [
+    make_srt(srt_path, [s[3] for s in slides], [
         ("Title", title_txt),
         ("Scripture", verse_full + (" " + sub if sub else "")),
         ("Reflection", reflection),
@@ -263,5 +376,9 @@ if __name__ == "__main__":
     ap.add_argument("--date", help="YYYY-MM-DD (defaults to local Nassau date or SOULSTART_DATE)")
     ap.add_argument("--json", default=DEFAULT_JSON, help="Path to Sunset JSON")
     ap.add_argument("--sign", default=None, help="Path to sign-language video (mp4)")
+    ap.add_argument("--codec", default="libx264", help="ffmpeg video codec, e.g. h264_nvenc (falls back to libx264)")
+    ap.add_argument("--preset", default="medium", help="Encoder preset, e.g. veryfast for quicker drafts")
+    ap.add_argument("--renderer", choices=("moviepy", "ffmpeg"), default="moviepy",
+                    help="ffmpeg writes each slide once and lets ffmpeg composite (much faster)")
     args = ap.parse_args()
     build_video(args)